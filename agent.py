@@ -9,7 +9,6 @@ This tool provides easy access to development automation agents.
 import sys
 from pathlib import Path
 from typing import List, Optional
-import json
 
 # Add project root to Python path
 ROOT = Path(__file__).resolve().parent
@@ -19,13 +18,14 @@ if str(ROOT) not in sys.path:
 try:
     import typer
     from rich.console import Console
-    from rich.table import Table
-    from rich.panel import Panel
 except ImportError:
     print("Missing dependencies. Please install with:")
     print("pip install typer rich")
     sys.exit(1)
 
+# Heavier rich widgets (Table, Panel) and stdlib helpers (json, subprocess)
+# are imported inside the commands that need them to keep CLI cold-start low.
+
 from coding_agents import agent_registry, ServiceGeneratorAgent
 
 app = typer.Typer(help="ark-os-noa Coding Agents CLI")
@@ -34,15 +34,20 @@ console = Console()
 @app.command()
 def list_agents():
     """List all available coding agents"""
-    # Initialize agents to register them
-    ServiceGeneratorAgent()
-    
     agents = agent_registry.list_agents()
-    
+
+    if not console.is_terminal:
+        # Plain text for pipes/redirects: skip the Table formatter entirely
+        for agent_name in agents:
+            print(agent_name)
+        return
+
+    from rich.table import Table
+
     if not agents:
         console.print("No agents registered", style="yellow")
         return
-    
+
     table = Table(title="Available Coding Agents")
     table.add_column("Agent Name", style="cyan")
     table.add_column("Description", style="green")
@@ -63,13 +68,17 @@ def generate_service(
     endpoints: Optional[List[str]] = typer.Option(None, "--endpoint", "-e", help="Endpoints to include")
 ):
     """Generate a new microservice"""
-    
+    from rich.panel import Panel
+    from rich.table import Table
+
     console.print(f"🚀 Generating service: {name}", style="bold blue")
     
     try:
-        # Initialize agent (this will register it)
-        agent = ServiceGeneratorAgent()
-        
+        # Reuse the agent registered at import time
+        agent = agent_registry.get_agent("service-generator")
+        if agent is None:
+            agent = ServiceGeneratorAgent()
+
         result = agent.execute(
             service_name=name,
             endpoints=endpoints or ["/", "/health", "/process"]
@@ -105,21 +114,35 @@ def generate_service(
 @app.command()
 def health_check():
     """Check the health of the development environment"""
+    import os
+
+    # One scandir pass instead of a stat per checked item
+    present = {entry.name for entry in os.scandir(".")}
+
+    required_files = ["requirements.txt", "docker-compose.yml", "services", "tests"]
+
+    if not console.is_terminal:
+        # Plain text for pipes/redirects
+        for file_path in required_files:
+            print(f"{file_path}: {'ok' if file_path in present else 'missing'}")
+        print(f"venv: {'ok' if 'venv' in present else 'missing'}")
+        return
+
+    from rich.table import Table
+
     console.print("🏥 Checking environment health...", style="bold blue")
-    
+
     checks = []
-    
+
     # Check workspace structure
-    required_files = ["requirements.txt", "docker-compose.yml", "services", "tests"]
     for file_path in required_files:
-        path = Path(file_path)
-        if path.exists():
+        if file_path in present:
             checks.append((file_path, "✅", "green"))
         else:
             checks.append((file_path, "❌", "red"))
-    
+
     # Check virtual environment
-    if Path("venv").exists():
+    if "venv" in present:
         checks.append(("Virtual Environment", "✅", "green"))
     else:
         checks.append(("Virtual Environment", "⚠️", "yellow"))
@@ -141,28 +164,53 @@ def run_service(
     reload: bool = typer.Option(True, "--reload/--no-reload", help="Enable auto-reload")
 ):
     """Run a specific service"""
-    import subprocess
-    
+    import os
+
     service_path = Path(f"services/{name}/main.py")
-    
+
     if not service_path.exists():
         console.print(f"❌ Service '{name}' not found at {service_path}", style="bold red")
         raise typer.Exit(1)
-    
+
     console.print(f"🚀 Starting service '{name}' on port {port}", style="bold green")
-    
-    cmd = [
-        "uvicorn", 
-        f"services.{name}.main:app",
-        "--host", "0.0.0.0",
-        "--port", str(port)
-    ]
-    
-    if reload:
-        cmd.append("--reload")
-    
+
     try:
-        subprocess.run(cmd)
+        if reload:
+            # The auto-reload watcher needs its own process; keep the
+            # subprocess launch for that case
+            import subprocess
+
+            cmd = [
+                "uvicorn",
+                f"services.{name}.main:app",
+                "--host", "0.0.0.0",
+                "--port", str(port),
+                "--loop", "uvloop",
+                "--http", "httptools",
+                "--reload"
+            ]
+            # Hand the child the project root directly so generated
+            # services never need to probe for it with sys.path hacks
+            subprocess.run(
+                cmd,
+                env={**os.environ, "PYTHONPATH": str(ROOT), "ARK_ROOT": str(ROOT)}
+            )
+        else:
+            # Embed uvicorn in this process: no second interpreter start,
+            # and the FastAPI stack loaded here is reused directly
+            import importlib
+
+            import uvicorn
+
+            module = importlib.import_module(f"services.{name}.main")
+            config = uvicorn.Config(
+                module.app,
+                host="0.0.0.0",
+                port=port,
+                loop="uvloop",
+                http="httptools"
+            )
+            uvicorn.Server(config).run()
     except KeyboardInterrupt:
         console.print("\n👋 Service stopped", style="yellow")
     except Exception as e:
@@ -171,35 +219,122 @@ def run_service(
 @app.command()
 def logs(
     agent: str = typer.Argument(..., help="Agent name to view logs for"),
-    format: str = typer.Option("pretty", "--format", "-f", help="Output format: pretty or json")
+    format: str = typer.Option("pretty", "--format", "-f", help="Output format: pretty or json"),
+    tail: int = typer.Option(0, "--tail", "-n", help="Show only the last N entries (0 = all)")
 ):
     """View agent execution logs"""
+    import json
+
+    from rich.table import Table
+
+    try:
+        from orjson import loads as _loads
+    except ImportError:
+        _loads = json.loads
+
+    try:
+        from mapbuffer import MapBuffer
+    except ImportError:
+        MapBuffer = None
+
+    mb_path = Path(f"logs/{agent}_execution.mb")
+    jsonl_path = Path(f"logs/{agent}_execution.jsonl")
     log_path = Path(f"logs/{agent}_execution.json")
-    
-    if not log_path.exists():
+
+    # The .mb sidecar is rewritten only by save_execution_log, while
+    # log_execution appends straight to the JSONL, so the index may lag
+    # behind; only trust it when it is at least as fresh as the JSONL
+    mb_current = (
+        MapBuffer is not None
+        and mb_path.exists()
+        and (
+            not jsonl_path.exists()
+            or mb_path.stat().st_mtime >= jsonl_path.stat().st_mtime
+        )
+    )
+
+    if mb_current:
+        # Indexed format: decode only the requested slice, the rest of the
+        # file is never parsed (MapBuffer mmaps it internally)
+        with open(mb_path, 'rb') as f:
+            mb = MapBuffer(f)
+            start = max(0, len(mb) - tail) if tail else 0
+            log_data = [_loads(mb[i]) for i in range(start, len(mb))]
+    elif jsonl_path.exists():
+        # Primary format: one JSON entry per line, parsed in a single pass
+        with open(jsonl_path, 'rb', buffering=65536) as f:
+            lines = f.read().splitlines()
+        if tail:
+            lines = lines[-tail:]
+        log_data = [_loads(line) for line in lines]
+    elif log_path.exists():
+        # Legacy format: whole log as one JSON array
+        if log_path.stat().st_size > 64 * 1024:
+            # Large file: memory-map for zero-copy access instead of
+            # pulling the whole file through the read buffer
+            import mmap
+
+            with open(log_path, 'rb') as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    try:
+                        log_data = _loads(memoryview(mm))
+                    except TypeError:
+                        # stdlib json only accepts str/bytes/bytearray
+                        log_data = _loads(mm[:])
+        else:
+            # Buffered binary read: skip the text-IO decode layer
+            with open(log_path, 'rb', buffering=65536) as f:
+                log_data = _loads(f.read())
+        if tail:
+            log_data = log_data[-tail:]
+    else:
         console.print(f"❌ No logs found for agent '{agent}'", style="bold red")
         raise typer.Exit(1)
-    
-    with open(log_path) as f:
-        log_data = json.load(f)
-    
+
     if format == "json":
         console.print_json(data=log_data)
+    elif not console.is_terminal:
+        # Plain text for pipes/redirects: one tab-separated line per entry
+        from datetime import datetime, timezone
+
+        for entry in log_data:
+            timestamp = entry["timestamp"]
+            if isinstance(timestamp, int):
+                timestamp = datetime.fromtimestamp(
+                    timestamp / 1e9, timezone.utc
+                ).isoformat()
+            details = entry.get("details")
+            line = f"{timestamp}\t{entry['action']}"
+            if details:
+                line += f"\t{json.dumps(details)}"
+            print(line)
     else:
         # Pretty format
         logs_table = Table(title=f"Execution Logs for {agent}")
         logs_table.add_column("Timestamp", style="cyan")
         logs_table.add_column("Action", style="green")
         logs_table.add_column("Details", style="white")
-        
+
+        from datetime import datetime, timezone
+
+        # Bind one encoder instead of re-creating it via json.dumps per row
+        encode_details = json.JSONEncoder(indent=2).encode
+
         for entry in log_data:
-            details = json.dumps(entry.get("details", {}), indent=2) if entry.get("details") else ""
+            details = entry.get("details")
+            timestamp = entry["timestamp"]
+            if isinstance(timestamp, int):
+                # Entries store a raw time.time_ns reading; format only the
+                # rows actually shown (legacy entries are ISO strings)
+                timestamp = datetime.fromtimestamp(
+                    timestamp / 1e9, timezone.utc
+                ).isoformat()
             logs_table.add_row(
-                entry["timestamp"],
+                timestamp,
                 entry["action"],
-                details
+                encode_details(details) if details else ""
             )
-        
+
         console.print(logs_table)
 
 if __name__ == "__main__":
@@ -8,6 +8,11 @@ common development tasks in the ark-os-noa platform.
 from .base_agent import BaseAgent, AgentRegistry, agent_registry
 from .service_generator import ServiceGeneratorAgent
 
+# Instantiate the default agents once at import time so CLI commands can
+# fetch them from the registry instead of rebuilding logger/registry state
+# on every invocation.
+_default_service_generator = ServiceGeneratorAgent()
+
 __all__ = [
     "BaseAgent",
     "AgentRegistry", 
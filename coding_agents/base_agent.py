@@ -10,7 +10,38 @@ from typing import Dict, Any, List, Optional
 from pathlib import Path
 import logging
 import json
-from datetime import datetime
+import os
+import time
+
+try:
+    from mapbuffer import MapBuffer
+except ImportError:
+    # Optional: indexed log storage with O(1) random lookup
+    MapBuffer = None
+
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+    def _dumps_indent(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    # Fall back to stdlib json (2-5x slower to serialize)
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
+    def _dumps_indent(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2).encode()
+
+# All agents share the same log format, so build the formatter and handler
+# once instead of per agent instance
+_LOG_FORMATTER = logging.Formatter(
+    '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+_LOG_HANDLER = logging.StreamHandler()
+_LOG_HANDLER.setFormatter(_LOG_FORMATTER)
 
 class BaseAgent(ABC):
     """Base class for all coding agents"""
@@ -20,31 +51,39 @@ class BaseAgent(ABC):
         self.workspace_path = workspace_path or Path.cwd()
         self.logger = self._setup_logging()
         self.execution_log: List[Dict[str, Any]] = []
+        self._jsonl_path = self.workspace_path / f"logs/{self.name}_execution.jsonl"
+        # Cached validate_workspace result; only valid while workspace_path
+        # stays unchanged
+        self._workspace_valid: Optional[bool] = None
     
     def _setup_logging(self) -> logging.Logger:
         """Setup logging for the agent"""
         logger = logging.getLogger(f"agent.{self.name}")
         logger.setLevel(logging.INFO)
-        
+
         if not logger.handlers:
-            handler = logging.StreamHandler()
-            formatter = logging.Formatter(
-                '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-            )
-            handler.setFormatter(formatter)
-            logger.addHandler(handler)
-        
+            logger.addHandler(_LOG_HANDLER)
+
         return logger
     
     def log_execution(self, action: str, details: Dict[str, Any] = None):
         """Log agent execution for audit trail"""
         entry = {
-            "timestamp": datetime.utcnow().isoformat(),
+            # Raw nanosecond clock reading: far cheaper than building and
+            # formatting a datetime here; readers format it for display
+            "timestamp": time.time_ns(),
             "agent": self.name,
             "action": action,
             "details": details or {},
         }
         self.execution_log.append(entry)
+
+        # Append-only JSONL audit trail: O(1) per entry instead of
+        # rewriting the whole log array on every save
+        self._jsonl_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self._jsonl_path, 'ab', buffering=0) as f:
+            f.write(_dumps(entry) + b'\n')
+
         self.logger.info(f"Action: {action}")
     
     @abstractmethod
@@ -54,52 +93,73 @@ class BaseAgent(ABC):
     
     def validate_workspace(self) -> bool:
         """Validate that we're in a valid ark-os-noa workspace"""
-        required_files = ["requirements.txt", "docker-compose.yml", "services"]
-        
-        for item in required_files:
-            path = self.workspace_path / item
-            if not path.exists():
-                self.logger.error(f"Required workspace item not found: {item}")
-                return False
-        
-        return True
+        if self._workspace_valid is not None:
+            return self._workspace_valid
+
+        required = {"requirements.txt", "docker-compose.yml", "services"}
+
+        # One scandir pass instead of a stat syscall per required item
+        try:
+            present = {entry.name for entry in os.scandir(self.workspace_path)}
+        except OSError:
+            present = set()
+
+        for item in required - present:
+            self.logger.error(f"Required workspace item not found: {item}")
+
+        self._workspace_valid = required <= present
+        return self._workspace_valid
     
     def save_execution_log(self, output_path: Path = None):
-        """Save execution log to file"""
+        """Export the in-memory log as a single JSON array.
+
+        Kept for compatibility; the JSONL file written by ``log_execution``
+        is the primary audit trail.
+        """
         if not output_path:
             output_path = self.workspace_path / f"logs/{self.name}_execution.json"
         
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        with open(output_path, 'w') as f:
-            json.dump(self.execution_log, f, indent=2)
-        
+
+        with open(output_path, 'wb') as f:
+            f.write(_dumps_indent(self.execution_log))
+
+        if MapBuffer is not None:
+            # Indexed sidecar keyed by step number, so readers can fetch a
+            # slice (e.g. the tail) without parsing the whole log
+            mb = MapBuffer({
+                i: _dumps(entry)
+                for i, entry in enumerate(self.execution_log)
+            })
+            output_path.with_suffix('.mb').write_bytes(mb.tobytes())
+
         self.logger.info(f"Execution log saved to {output_path}")
 
 class AgentRegistry:
     """Registry to manage and discover coding agents"""
-    
+
+    __slots__ = ("_agents", "get_agent")
+
     def __init__(self):
         self._agents: Dict[str, BaseAgent] = {}
-    
+        # get_agent is the bound dict.get itself, so hot dispatch paths
+        # skip a method-call indirection per lookup
+        self.get_agent = self._agents.get
+
     def register(self, agent: BaseAgent):
         """Register an agent"""
         self._agents[agent.name] = agent
-    
-    def get_agent(self, name: str) -> Optional[BaseAgent]:
-        """Get an agent by name"""
-        return self._agents.get(name)
-    
+
     def list_agents(self) -> List[str]:
         """List all registered agent names"""
-        return list(self._agents.keys())
-    
+        return list(self._agents)
+
     def execute_agent(self, name: str, **kwargs) -> Dict[str, Any]:
         """Execute an agent by name"""
         agent = self.get_agent(name)
         if not agent:
             raise ValueError(f"Agent '{name}' not found")
-        
+
         return agent.execute(**kwargs)
 
 # Global agent registry instance
@@ -5,17 +5,188 @@ This agent automates the creation of new microservices following the established
 patterns in the ark-os-noa platform.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Tuple
+import functools
+import py_compile
+import re
 import textwrap
 from .base_agent import BaseAgent, register_agent
 
+# Anchors for splicing a new service into pipeline.py in one pass
+_PIPELINE_IMPORT_RE = re.compile(
+    r'((?:^from services\.\w+ import main as \w+\n)+)', re.M
+)
+_PIPELINE_SEQ_RE = re.compile(
+    r'(SERVICE_SEQUENCE\s*=\s*\[[^\]]*?)(\n\])', re.S
+)
+_PIPELINE_SERVICE_RE = re.compile(r'from services\.(\w+) import main')
+
+# Generated requirements.txt never varies per service, so dedent it once
+# at import time
+_REQUIREMENTS_CONTENT = textwrap.dedent('''
+# Service-specific dependencies
+# Inherits from main requirements.txt
+
+# Fast event loop and HTTP parser for uvicorn
+uvloop
+httptools
+
+# Add service-specific packages here
+# Example:
+# pandas==2.0.3
+# numpy==1.24.3
+''').strip()
+
+
+# Handler templates keyed by endpoint; unknown endpoints fall back to the
+# generic GET handler
+_HANDLER_TEMPLATES = {
+    "/": '''@app.get("/")
+async def root():
+    return {{"service": "{service}"}}''',
+    "/health": '''@app.get("/health")
+async def health():
+    return {{"status": "healthy", "service": "{service}"}}''',
+    "/process": '''@app.post("/process")
+async def process_data(data: dict):
+    """Process incoming data and return results"""
+    result = process(data)
+    return {{"success": True, "result": result}}''',
+}
+
+_GENERIC_HANDLER = '''@app.get("{endpoint}")
+async def {name}():
+    return {{"endpoint": "{endpoint}", "service": "{service}"}}'''
+
+
+@functools.lru_cache(maxsize=128)
+def _generate_main_py(service_name: str, endpoints: Tuple[str, ...]) -> str:
+    """Generate the main FastAPI application file"""
+
+    handlers = [
+        _HANDLER_TEMPLATES.get(endpoint, _GENERIC_HANDLER).format(
+            service=service_name,
+            endpoint=endpoint,
+            name=endpoint.strip("/").replace("-", "_"),
+        )
+        for endpoint in endpoints
+    ]
+    endpoints_code = "\n\n".join(handlers)
+
+    return f'''from fastapi import FastAPI
+from typing import Dict, Any
+
+app = FastAPI(
+    title="{service_name} Service",
+    description="Microservice for {service_name} operations in ark-os-noa",
+    version="1.0.0"
+)
+
+{endpoints_code}
+
+def process(job: Dict[str, Any]) -> Dict[str, Any]:
+    """Process job data through this service."""
+    job.setdefault("steps", []).append("{service_name}")
+
+    # Add service-specific processing logic here
+    job.setdefault("processed_by", []).append("{service_name}")
+
+    return job
+
+if __name__ == "__main__":
+    import uvicorn
+    uvicorn.run(app, host="0.0.0.0", port=8000, loop="uvloop", http="httptools")
+'''
+
+
+@functools.lru_cache(maxsize=128)
+def _generate_dockerfile(service_name: str) -> str:
+    """Generate Dockerfile for the service"""
+    return textwrap.dedent(f'''
+    FROM python:3.11-slim
+
+    WORKDIR /app
+
+    # Copy requirements and install dependencies
+    COPY requirements.txt .
+    COPY ../../requirements.txt ./base-requirements.txt
+    RUN pip install -r base-requirements.txt && \\
+        pip install -r requirements.txt
+
+    # Copy service code
+    COPY . .
+
+    # Expose port
+    EXPOSE 8000
+
+    # Health check
+    HEALTHCHECK --interval=30s --timeout=3s --start-period=5s --retries=3 \\
+        CMD curl -f http://localhost:8000/health || exit 1
+
+    # Run service
+    CMD ["uvicorn", "main:app", "--host", "0.0.0.0", "--port", "8000"]
+    ''').strip()
+
+
+@functools.lru_cache(maxsize=128)
+def _generate_test_file(service_name: str) -> str:
+    """Generate test file for the service"""
+    return textwrap.dedent(f'''
+    import importlib
+    import os
+    import sys
+
+    import pytest
+    from fastapi.testclient import TestClient
+
+    # Add project root to path; ARK_ROOT (set by the CLI) short-circuits
+    # the resolution, and os.path avoids Path.resolve's symlink walk
+    ROOT = os.environ.get("ARK_ROOT") or os.path.dirname(
+        os.path.dirname(os.path.abspath(__file__))
+    )
+    if ROOT not in sys.path:
+        sys.path.append(ROOT)
+
+    # Normal import machinery: works with hyphenated directory names and
+    # caches the module in sys.modules instead of re-executing it
+    service_main = importlib.import_module("services.{service_name}.main")
+
+    app = service_main.app
+    process = service_main.process
+
+    client = TestClient(app)
+
+    # Computed once so each test does a set lookup, not route introspection
+    _ROUTE_PATHS = {{getattr(route, "path", None) for route in app.routes}}
+
+    def test_health_endpoint():
+        if "/health" not in _ROUTE_PATHS:
+            pytest.skip("no health endpoint")
+
+        response = client.get("/health")
+        assert response.status_code == 200
+        assert response.json()["status"] == "healthy"
+
+    def test_process_function():
+        job = {{"data": "test"}}
+        result = process(job)
+        assert "{service_name}" in result["steps"]
+        assert "{service_name}" in result["processed_by"]
+    ''').strip()
+
+
 @register_agent
 class ServiceGeneratorAgent(BaseAgent):
     """Agent that generates new microservice boilerplate"""
     
     def __init__(self, workspace_path: Path = None):
         super().__init__("service-generator", workspace_path)
+        # Lazily-populated caches of pipeline.py, so bulk generation checks
+        # service presence against a set instead of rescanning the file
+        self._pipeline_content = None
+        self._pipeline_imports = None
     
     def execute(self, service_name: str, endpoints: List[str] = None, **kwargs) -> Dict[str, Any]:
         """Generate a new microservice"""
@@ -27,7 +198,9 @@ class ServiceGeneratorAgent(BaseAgent):
         # Default endpoints if none provided
         if endpoints is None:
             endpoints = ["/", "/health", "/process"]
-        
+        # Tuple key so the template caches can memoize on it
+        endpoints = tuple(endpoints)
+
         service_path = self.workspace_path / "services" / service_name
         
         if service_path.exists():
@@ -39,41 +212,39 @@ class ServiceGeneratorAgent(BaseAgent):
         service_path.mkdir(parents=True)
         self.log_execution("created_directory", {"path": str(service_path)})
         
-        # Generate files
-        files_created = []
-        
-        # 1. Create __init__.py
-        init_path = service_path / "__init__.py"
-        init_path.write_text("")
-        files_created.append(str(init_path))
-        
-        # 2. Create main.py
-        main_py_content = self._generate_main_py(service_name, endpoints)
-        main_path = service_path / "main.py"
-        main_path.write_text(main_py_content)
-        files_created.append(str(main_path))
-        
-        # 3. Create requirements.txt (service-specific dependencies)
-        requirements_content = self._generate_requirements()
-        req_path = service_path / "requirements.txt"
-        req_path.write_text(requirements_content)
-        files_created.append(str(req_path))
-        
-        # 4. Create Dockerfile
-        dockerfile_content = self._generate_dockerfile(service_name)
-        docker_path = service_path / "Dockerfile"
-        docker_path.write_text(dockerfile_content)
-        files_created.append(str(docker_path))
-        
-        # 5. Update pipeline.py to include new service
+        # Generate files: pre-encode every payload once, then write each in
+        # a single binary call (no per-file text-encoding layer)
+        payloads = [
+            (service_path / "__init__.py", b""),
+            (service_path / "main.py",
+             _generate_main_py(service_name, endpoints).encode()),
+            (service_path / "requirements.txt",
+             _REQUIREMENTS_CONTENT.encode()),
+            (service_path / "Dockerfile",
+             _generate_dockerfile(service_name).encode()),
+            (self.workspace_path / "tests" / f"test_{service_name}.py",
+             _generate_test_file(service_name).encode()),
+        ]
+
+        # The payloads are independent files, so overlap the IO across a
+        # small thread pool; _update_pipeline below stays sequential since
+        # it read-modify-writes a shared file
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(lambda item: item[0].write_bytes(item[1]), payloads))
+
+        # Pre-compile the generated sources so the first import (uvicorn or
+        # pytest) loads bytecode instead of compiling on cold start;
+        # optimize=-1 matches the running interpreter's level so the cache
+        # is the one later imports actually consult
+        for path, _ in payloads:
+            if path.suffix == ".py":
+                py_compile.compile(str(path), doraise=False, optimize=-1)
+
+        files_created = [str(path) for path, _ in payloads]
+
+        # Update pipeline.py to include new service
         self._update_pipeline(service_name)
-        
-        # 6. Generate tests
-        test_file = self._generate_test_file(service_name)
-        test_path = self.workspace_path / "tests" / f"test_{service_name}.py"
-        test_path.write_text(test_file)
-        files_created.append(str(test_path))
-        
+
         self.log_execution("service_generated", {
             "service_name": service_name,
             "files_created": files_created,
@@ -92,148 +263,6 @@ class ServiceGeneratorAgent(BaseAgent):
             ]
         }
     
-    def _generate_main_py(self, service_name: str, endpoints: List[str]) -> str:
-        """Generate the main FastAPI application file"""
-        
-        endpoint_handlers = []
-        for endpoint in endpoints:
-            if endpoint == "/":
-                handler = '''@app.get("/")
-async def root():
-    return {"service": "''' + service_name + '''"}'''
-            elif endpoint == "/health":
-                handler = '''@app.get("/health")
-async def health():
-    return {"status": "healthy", "service": "''' + service_name + '''"}'''
-            elif endpoint == "/process":
-                handler = '''@app.post("/process")
-async def process_data(data: dict):
-    """Process incoming data and return results"""
-    result = process(data)
-    return {"success": True, "result": result}'''
-            else:
-                # Generic endpoint
-                endpoint_name = endpoint.strip("/").replace("-", "_")
-                handler = f'''@app.get("{endpoint}")
-async def {endpoint_name}():
-    return {{"endpoint": "{endpoint}", "service": "{service_name}"}}'''
-            
-            endpoint_handlers.append(handler)
-        
-        endpoints_code = "\n\n".join(endpoint_handlers)
-        
-        return f'''from fastapi import FastAPI
-from typing import Dict, Any
-
-app = FastAPI(
-    title="{service_name} Service",
-    description="Microservice for {service_name} operations in ark-os-noa",
-    version="1.0.0"
-)
-
-{endpoints_code}
-
-def process(job: Dict[str, Any]) -> Dict[str, Any]:
-    """Process job data through this service."""
-    job.setdefault("steps", []).append("{service_name}")
-    
-    # Add service-specific processing logic here
-    job.setdefault("processed_by", []).append("{service_name}")
-    
-    return job
-
-if __name__ == "__main__":
-    import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
-'''
-    
-    def _generate_requirements(self) -> str:
-        """Generate service-specific requirements"""
-        return textwrap.dedent('''
-        # Service-specific dependencies
-        # Inherits from main requirements.txt
-        
-        # Add service-specific packages here
-        # Example:
-        # pandas==2.0.3
-        # numpy==1.24.3
-        ''').strip()
-    
-    def _generate_dockerfile(self, service_name: str) -> str:
-        """Generate Dockerfile for the service"""
-        return textwrap.dedent(f'''
-        FROM python:3.11-slim
-        
-        WORKDIR /app
-        
-        # Copy requirements and install dependencies
-        COPY requirements.txt .
-        COPY ../../requirements.txt ./base-requirements.txt
-        RUN pip install -r base-requirements.txt && \\
-            pip install -r requirements.txt
-        
-        # Copy service code
-        COPY . .
-        
-        # Expose port
-        EXPOSE 8000
-        
-        # Health check
-        HEALTHCHECK --interval=30s --timeout=3s --start-period=5s --retries=3 \\
-            CMD curl -f http://localhost:8000/health || exit 1
-        
-        # Run service
-        CMD ["uvicorn", "main:app", "--host", "0.0.0.0", "--port", "8000"]
-        ''').strip()
-    
-    def _generate_test_file(self, service_name: str) -> str:
-        """Generate test file for the service"""
-        # Convert hyphenated names to underscores for imports
-        import_name = service_name.replace('-', '_')
-        
-        return textwrap.dedent(f'''
-        import sys
-        from pathlib import Path
-        from fastapi.testclient import TestClient
-        
-        # Add project root to path
-        ROOT = Path(__file__).resolve().parents[1]
-        if str(ROOT) not in sys.path:
-            sys.path.append(str(ROOT))
-        
-        # Import using the actual directory name (hyphens preserved)
-        import importlib.util
-        
-        # Dynamic import for hyphenated service names
-        spec = importlib.util.spec_from_file_location(
-            "service_main", 
-            ROOT / "services" / "{service_name}" / "main.py"
-        )
-        service_main = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(service_main)
-        
-        app = service_main.app
-        process = service_main.process
-        
-        client = TestClient(app)
-        
-        def test_health_endpoint():
-            # Test health endpoint if it exists
-            try:
-                response = client.get("/health")
-                assert response.status_code == 200
-                assert response.json()["status"] == "healthy"
-            except:
-                # Health endpoint might not exist, skip this test
-                pass
-        
-        def test_process_function():
-            job = {{"data": "test"}}
-            result = process(job)
-            assert "{service_name}" in result["steps"]
-            assert "{service_name}" in result["processed_by"]
-        ''').strip()
-    
     def _update_pipeline(self, service_name: str):
         """Update pipeline.py to include the new service"""
         pipeline_path = self.workspace_path / "pipeline.py"
@@ -247,23 +276,28 @@ if __name__ == "__main__":
             self.logger.warning(f"Service '{service_name}' has hyphens - skipping pipeline update (use underscores for pipeline integration)")
             return
         
-        content = pipeline_path.read_text()
-        
-        # Add import
+        if self._pipeline_imports is None:
+            self._pipeline_content = pipeline_path.read_text()
+            self._pipeline_imports = set(
+                _PIPELINE_SERVICE_RE.findall(self._pipeline_content)
+            )
+
+        if service_name in self._pipeline_imports:
+            return
+
         import_line = f"from services.{service_name} import main as {service_name}"
-        if import_line not in content:
-            # Find the last import and add after it
-            lines = content.split('\n')
-            for i, line in enumerate(lines):
-                if line.startswith('from services.') and 'import main as' in line:
-                    lines.insert(i + 1, import_line)
-                    break
-            
-            # Add to SERVICE_SEQUENCE
-            for i, line in enumerate(lines):
-                if line.strip() == "]" and "SERVICE_SEQUENCE" in lines[i-5:i]:
-                    lines.insert(i, f"    {service_name},")
-                    break
-            
-            pipeline_path.write_text('\n'.join(lines))
-            self.log_execution("updated_pipeline", {"service_name": service_name})
\ No newline at end of file
+
+        # Splice the import after the existing service-import block and the
+        # module into SERVICE_SEQUENCE, each with one compiled substitution
+        content = _PIPELINE_IMPORT_RE.sub(
+            lambda m: m.group(1) + import_line + '\n',
+            self._pipeline_content, count=1
+        )
+        content = _PIPELINE_SEQ_RE.sub(
+            rf'\g<1>\n    {service_name},\g<2>', content, count=1
+        )
+
+        pipeline_path.write_text(content)
+        self._pipeline_content = content
+        self._pipeline_imports.add(service_name)
+        self.log_execution("updated_pipeline", {"service_name": service_name})
\ No newline at end of file
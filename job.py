@@ -3,28 +3,50 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, List
-import uuid
+import os
+import secrets
 
 
-@dataclass
+@dataclass(slots=True)
 class Job:
     """Simple job container passed between pipeline services."""
 
     data: Any
     workspace: Path
     steps: List[str] = field(default_factory=list)
+    # Cached workspace directory fd so markers open relative to it
+    _ws_fd: int = field(default=-1, init=False, repr=False)
 
     @classmethod
     def create(cls, data: Any, base_dir: Path | None = None) -> "Job":
-        """Create a job with a unique workspace directory."""
+        """Create a job with a unique workspace path.
+
+        The directory itself is made lazily by the first recorded step, so
+        jobs that are created and discarded never touch the filesystem.
+        """
         base = base_dir or Path("workspaces")
-        base.mkdir(parents=True, exist_ok=True)
-        workspace = base / f"job-{uuid.uuid4().hex}"
-        workspace.mkdir()
+        # token_hex is cheaper than allocating a uuid object for a name
+        workspace = base / f"job-{secrets.token_hex(16)}"
         return cls(data=data, workspace=workspace)
 
     def record_step(self, name: str) -> None:
         """Append a step name to the trace and create a marker file."""
         self.steps.append(name)
-        marker = self.workspace / f"{name}.txt"
-        marker.write_text(name)
+        if self._ws_fd < 0:
+            self.workspace.mkdir(parents=True, exist_ok=True)
+            self._ws_fd = os.open(self.workspace, os.O_RDONLY | os.O_DIRECTORY)
+        # Single open/write/close relative to the cached dir fd; skips the
+        # Path machinery and re-resolving the workspace path per marker
+        fd = os.open(f"{name}.txt", os.O_WRONLY | os.O_CREAT | os.O_TRUNC,
+                     0o644, dir_fd=self._ws_fd)
+        try:
+            os.write(fd, name.encode())
+        finally:
+            os.close(fd)
+
+    def __del__(self, _close=os.close):
+        if self._ws_fd >= 0:
+            try:
+                _close(self._ws_fd)
+            except OSError:
+                pass
@@ -0,0 +1,21 @@
+"""Load the hyphenated test-service through the regular import machinery.
+
+With the service directory on sys.path, ``import main`` goes through the
+normal finder: sys.modules caching and .pyc fast paths apply, so repeated
+loads never re-execute the module the way exec_module does.
+"""
+import importlib
+import os
+import sys
+
+from conftest import ROOT
+
+_SERVICE_DIR = os.path.join(ROOT, "services", "test-service")
+if _SERVICE_DIR not in sys.path:
+    sys.path.insert(0, _SERVICE_DIR)
+
+service_main = sys.modules.get("service_main")
+if service_main is None:
+    service_main = importlib.import_module("main")
+    # Alias under the historical name so existing imports keep working
+    sys.modules["service_main"] = service_main
@@ -0,0 +1,50 @@
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+# Resolve the project root once for the whole session; test modules import
+# ROOT from here instead of re-running realpath per module. The set mirror
+# of sys.path makes the membership check O(1).
+ROOT = str(Path(__file__).resolve().parents[1])
+
+_SYS_PATH_SET = set(sys.path)
+if ROOT not in _SYS_PATH_SET:
+    sys.path.append(ROOT)
+    _SYS_PATH_SET.add(ROOT)
+
+
+@pytest.fixture(scope="session")
+def service():
+    """The loaded test-service module, one import per worker process.
+
+    _service_alias short-circuits through sys.modules, so xdist workers
+    pay the module exec at most once.
+    """
+    from _service_alias import service_main
+
+    return service_main
+
+
+@pytest.fixture(scope="session")
+def event_loop():
+    """Session-wide loop so the async client fixture can share its scope."""
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture(scope="session")
+async def client():
+    """One ASGI-transport client for the whole session.
+
+    Calls the app directly on the event loop, skipping TestClient's
+    per-request thread portal hop.
+    """
+    from _service_alias import service_main
+
+    transport = ASGITransport(app=service_main.app)
+    async with AsyncClient(transport=transport, base_url="http://testserver") as c:
+        yield c
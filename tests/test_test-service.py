@@ -1,40 +1,34 @@
-import sys
-from pathlib import Path
-from fastapi.testclient import TestClient
-
-# Add project root to path
-ROOT = Path(__file__).resolve().parents[1]
-if str(ROOT) not in sys.path:
-    sys.path.append(str(ROOT))
-
-# Import using the actual directory name (hyphens preserved)
-import importlib.util
-
-# Dynamic import for hyphenated service names
-spec = importlib.util.spec_from_file_location(
-    "service_main", 
-    ROOT / "services" / "test-service" / "main.py"
-)
-service_main = importlib.util.module_from_spec(spec)
-spec.loader.exec_module(service_main)
+import pytest
+
+from _service_alias import service_main
 
 app = service_main.app
 process = service_main.process
 
-client = TestClient(app)
+# Computed once so each test does a set lookup, not route introspection
+_ROUTE_PATHS = {getattr(route, "path", None) for route in app.routes}
+
+async def test_health_endpoint(client):
+    if "/health" not in _ROUTE_PATHS:
+        pytest.skip("no health endpoint")
 
-def test_health_endpoint():
-    # Test health endpoint if it exists
-    try:
-        response = client.get("/health")
-        assert response.status_code == 200
-        assert response.json()["status"] == "healthy"
-    except:
-        # Health endpoint might not exist, skip this test
-        pass
+    response = await client.get("/health")
+    assert response.status_code == 200
+    assert response.json()["status"] == "healthy"
+
+JOBS = [{"data": f"test-{i}"} for i in range(64)]
 
 def test_process_function():
+    # Single-case smoke check
     job = {"data": "test"}
     result = process(job)
     assert "test-service" in result["steps"]
-    assert "test-service" in result["processed_by"]
\ No newline at end of file
+    assert "test-service" in result["processed_by"]
+
+def test_process_batch():
+    # One pytest item amortizes collection and reporting overhead across
+    # the whole batch of payloads
+    for job in JOBS:
+        result = process(job)
+        assert "test-service" in result["steps"]
+        assert "test-service" in result["processed_by"]